@@ -54,6 +54,89 @@ if [ -f "$REPO_DIR/iterm-focus.sh" ]; then
     create_symlink "$REPO_DIR/iterm-focus.sh" "$CLAUDE_DIR/iterm-focus.sh" "iterm-focus.sh"
 fi
 
+# Build statusline.pyz: a zipapp carrying precompiled bytecode, so each
+# statusline poll loads a .pyc instead of recompiling statusline.py.
+# When mypy 1.x (with mypyc) is installed, statusline.py is also compiled to a
+# C extension that the zipapp imports ahead of the bytecode, provided the
+# compiled daemon passes a smoke test.
+if [ -f "$REPO_DIR/statusline.py" ]; then
+    NATIVE_DIR="$CLAUDE_DIR/statusline-native"
+    rm -rf "$NATIVE_DIR"
+    if python3 -c "import sys, mypy.version, mypyc; sys.exit(not mypy.version.__version__.startswith('1.'))" 2>/dev/null; then
+        echo "⚙️  Compiling statusline.py with mypyc..."
+        BUILD_DIR="$(mktemp -d)"
+        cp "$REPO_DIR/statusline.py" "$BUILD_DIR/"
+        if ! (cd "$BUILD_DIR" && python3 -m mypyc statusline.py >/dev/null 2>&1); then
+            echo "  ⚠️  mypyc build failed, using bytecode only"
+        # Start the compiled daemon in a scratch runtime dir and make one poll
+        elif ! (cd "$BUILD_DIR" && XDG_RUNTIME_DIR="$BUILD_DIR" python3 - >/dev/null 2>&1 <<'PYEOF'
+import subprocess, sys, time
+
+import statusline
+
+if not statusline.__file__.endswith('.so'):
+    sys.exit('statusline was not imported from the compiled extension')
+
+# Fresh caches keep the daemon's refresh away from the Keychain and network
+for cache_file in (statusline.SESSION_CACHE, statusline.WEEKLY_CACHE):
+    statusline.save_cache(cache_file, {'pct': 0})
+
+daemon = subprocess.Popen(
+    [sys.executable, '-c', 'import statusline; statusline.main()', '--daemon'],
+    stdin=subprocess.DEVNULL,
+)
+try:
+    output = None
+    deadline = time.monotonic() + 5
+    while not output and daemon.poll() is None and time.monotonic() < deadline:
+        time.sleep(0.1)
+        try:
+            output = statusline.query_daemon(b'{"model": "opus"}')
+        except OSError:
+            pass  # not listening yet
+    if not output or b'opus' not in output:
+        sys.exit('compiled daemon did not answer')
+    # Payload values arrive untyped; a float must render like in the bytecode build
+    output = statusline.query_daemon(b'{"context_window": {"context_window_size": 1000000.0}}')
+    if not output or b'context:' not in output:
+        sys.exit('compiled daemon failed on a float context window size')
+finally:
+    daemon.terminate()
+    daemon.wait()
+PYEOF
+        ); then
+            echo "  ⚠️  mypyc build failed its smoke test, using bytecode only"
+        else
+            mkdir -p "$NATIVE_DIR"
+            cp "$BUILD_DIR"/*.so "$NATIVE_DIR/"
+            echo "  ✅ Compiled to $NATIVE_DIR"
+        fi
+        rm -rf "$BUILD_DIR"
+    fi
+
+    echo "📦 Building statusline.pyz..."
+    python3 - "$REPO_DIR/statusline.py" "$CLAUDE_DIR/statusline.pyz" "$NATIVE_DIR" <<'PYEOF'
+import os, py_compile, shutil, sys, tempfile, zipapp
+
+source, target, native_dir = sys.argv[1], sys.argv[2], sys.argv[3]
+
+main = 'import statusline\n\nstatusline.main()\n'
+if os.path.isdir(native_dir):
+    main = f'import sys\n\nsys.path.insert(0, {native_dir!r})\n' + main
+
+with tempfile.TemporaryDirectory() as staging:
+    module = os.path.join(staging, 'statusline.py')
+    shutil.copy(source, module)
+    # zipimport only looks for a sibling .pyc (archives have no __pycache__);
+    # the .py stays as a fallback if the interpreter's bytecode magic changes
+    py_compile.compile(module, cfile=module + 'c', optimize=2, doraise=True)
+    with open(os.path.join(staging, '__main__.py'), 'w') as f:
+        f.write(main)
+    zipapp.create_archive(staging, target, interpreter='/usr/bin/env python3', compressed=True)
+print(f'  ✅ Built {target}')
+PYEOF
+fi
+
 # Symlink devbackend.md and ensure CLAUDE.md includes it
 if [ -f "$REPO_DIR/devbackend.md" ]; then
     echo "📄 Linking devbackend.md..."
@@ -188,4 +271,6 @@ echo "  - ~/.claude/agents/<name> -> $REPO_DIR/agents/<name> (per agent)"
 [ -d "$REPO_DIR/skills" ] && echo "  - ~/.claude/skills/<name> -> $REPO_DIR/skills/<name> (per skill)"
 [ -d "$REPO_DIR/commands" ] && echo "  - ~/.claude/commands/<name>.md -> $REPO_DIR/commands/<name>.md (per command)"
 [ -d "$REPO_DIR/examples" ] && echo "  - ~/.claude/examples/<name> -> $REPO_DIR/examples/<name> (per example)"
+[ -f "$REPO_DIR/statusline.py" ] && echo "  - ~/.claude/statusline.pyz built from $REPO_DIR/statusline.py (re-run after git pull)"
+[ -d "$CLAUDE_DIR/statusline-native" ] && echo "  - ~/.claude/statusline-native compiled with mypyc (preferred by statusline.pyz)"
 [ -f "$REPO_DIR/settings.json" ] && echo "  - ~/.claude/settings.json merged from $REPO_DIR/settings.json"
@@ -1,44 +1,110 @@
 #!/usr/bin/env python3
 
+import functools
 import json
+import math
 import os
-import subprocess
+import socket
+import stat
 import sys
 import time
-from datetime import datetime
-from pathlib import Path
 
-CACHE_DIR = Path.home() / ".cache" / "claude-statusline"
-SESSION_CACHE = CACHE_DIR / "session.json"
-WEEKLY_CACHE = CACHE_DIR / "weekly.json"
+# asyncio, http.client, ssl, subprocess, tempfile and datetime are imported
+# where they are used: polls answered by the daemon never need them, and
+# together they cost more to import than the whole render.
+
+# typing.TYPE_CHECKING without importing typing; mypy treats the name as true
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import asyncio
+
+
+def _cache_dir() -> str:
+    """Get a private per-user cache directory, preferring tmpfs over $HOME."""
+    # Every poll touches the cache, so keep it off a possibly networked home
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        path = os.path.join(runtime_dir, "claude-statusline")
+    else:
+        path = os.path.join("/tmp", f"claude-statusline-{os.getuid()}")
+    try:
+        try:
+            st = os.lstat(path)
+        except FileNotFoundError:
+            os.mkdir(path, 0o700)
+            st = os.lstat(path)
+        # Refuse directories (or symlinks) planted by another user
+        if stat.S_ISDIR(st.st_mode) and st.st_uid == os.getuid():
+            return path
+    except OSError:
+        pass
+    return os.path.join(os.path.expanduser("~"), ".cache", "claude-statusline")
+
+
+CACHE_DIR = _cache_dir()
+SESSION_CACHE = os.path.join(CACHE_DIR, "session.json")
+WEEKLY_CACHE = os.path.join(CACHE_DIR, "weekly.json")
+ETAG_CACHE = os.path.join(CACHE_DIR, "etag.json")
+DAEMON_SOCKET = os.path.join(CACHE_DIR, "daemon.sock")
+DAEMON_LOCK = os.path.join(CACHE_DIR, "daemon.lock")
+DAEMON_TIMEOUT = 1  # seconds a poll waits for the daemon
+DAEMON_IDLE_TIMEOUT = 600  # exit after 10 minutes without polls
+DAEMON_CHECK_INTERVAL = 30  # seconds between idle/upgrade checks
+HOT_CACHE_TTL = 1  # seconds a rendered line is reused for an identical poll
+HOT_CACHE_SIZE = 8  # distinct payloads kept (one per concurrent session)
+DEFAULT_CONTEXT_WINDOW = 200000
+DEFAULT_AUTOCOMPACT_THRESHOLD = 155000  # 77.5% of the default context window
+CONTEXT_TOKEN_KEYS = (
+    "input_tokens",
+    "cache_creation_input_tokens",
+    "cache_read_input_tokens",
+)
+_NO_TOKENS = (0,) * len(CONTEXT_TOKEN_KEYS)  # usage.get defaults, one per key
 SESSION_TTL = 60  # 1 minute
 WEEKLY_TTL = 300  # 5 minutes
+USAGE_HOST = "api.anthropic.com"
+USAGE_PATH = "/api/oauth/usage"
+KEYCHAIN_SERVICE = "Claude Code-credentials"
+SECURITY_FRAMEWORK = "/System/Library/Frameworks/Security.framework/Security"
+CORE_FOUNDATION = "/System/Library/Frameworks/CoreFoundation.framework/CoreFoundation"
+CF_STRING_ENCODING_UTF8 = 0x08000100
+ERR_SEC_SUCCESS = 0
+ERR_SEC_ITEM_NOT_FOUND = -25300
+ERR_SEC_ALLOCATE = -108
+
+
+# Catppuccin Mocha palette as 24-bit ANSI foreground escapes (hex in comments)
+C_RED = "\033[38;2;243;139;168m"  # #f38ba8
+C_YELLOW = "\033[38;2;249;226;175m"  # #f9e2af
+C_GREEN = "\033[38;2;166;227;161m"  # #a6e3a1
+C_CYAN = "\033[38;2;137;220;235m"  # #89dceb
+C_BLUE = "\033[38;2;137;180;250m"  # #89b4fa
+C_MAGENTA = "\033[38;2;203;166;247m"  # #cba6f7
+C_PINK = "\033[38;2;245;194;231m"  # #f5c2e7
+C_ORANGE = "\033[38;2;250;179;135m"  # #fab387
+C_GRAY = "\033[38;2;88;91;112m"  # #585b70
+C_SURFACE = "\033[38;2;49;50;68m"  # #313244
+C_TEXT = "\033[38;2;205;214;244m"  # #cdd6f4
+C_RESET = "\033[0m"
+SEPARATOR = f" {C_GRAY}│{C_RESET} "
 
+# Color for every percentage 0-100: red above 80, yellow above 60
+_PCT_COLORS = tuple(
+    C_RED if pct > 80 else C_YELLOW if pct > 60 else C_GREEN for pct in range(101)
+)
 
-def hex_to_ansi(hex_color: str) -> str:
-    """Convert hex color to ANSI escape sequence."""
-    hex_color = hex_color.lstrip("#")
-    r, g, b = int(hex_color[0:2], 16), int(hex_color[2:4], 16), int(hex_color[4:6], 16)
-    return f"\033[38;2;{r};{g};{b}m"
-
-
-# Catppuccin Mocha palette
-C_RED = hex_to_ansi("#f38ba8")
-C_YELLOW = hex_to_ansi("#f9e2af")
-C_GREEN = hex_to_ansi("#a6e3a1")
-C_CYAN = hex_to_ansi("#89dceb")
-C_BLUE = hex_to_ansi("#89b4fa")
-C_MAGENTA = hex_to_ansi("#cba6f7")
-C_PINK = hex_to_ansi("#f5c2e7")
-C_ORANGE = hex_to_ansi("#fab387")
-C_GRAY = hex_to_ansi("#585b70")
-C_SURFACE = hex_to_ansi("#313244")
-C_TEXT = hex_to_ansi("#cdd6f4")
-C_RESET = "\033[0m"
+# (filled, empty) segments for every fill level of the default-width bar
+BAR_WIDTH = 8
+_BARS = tuple(("▓" * i, "░" * (BAR_WIDTH - i)) for i in range(BAR_WIDTH + 1))
+
+# Parsed reset timestamps, keyed by the API's resets_at string
+RESET_EPOCHS_SIZE = 8
+_RESET_EPOCHS: dict[str, int | None] = {}
 
 
+@functools.lru_cache(maxsize=16)
 def get_model_color(model: str) -> str:
-    """Get color based on model name."""
+    """Get color based on model name (memoized: model IDs repeat across polls)."""
     model_lower = model.lower()
     if "opus" in model_lower:
         return C_GREEN
@@ -51,130 +117,299 @@ def get_model_color(model: str) -> str:
 
 def read_advisor_model() -> str | None:
     """Read advisor model from Claude settings.json."""
-    settings_path = Path.home() / ".claude" / "settings.json"
+    settings_path = os.path.join(os.path.expanduser("~"), ".claude", "settings.json")
     try:
-        with open(settings_path) as f:
-            settings = json.load(f)
+        with open(settings_path, "rb") as f:
+            settings = json.loads(f.read())
         return settings.get("advisorModel")
-    except (OSError, json.JSONDecodeError):
+    except (OSError, ValueError):
         return None
 
 
-def get_pct_color(pct: int) -> str:
+def get_pct_color(pct: float) -> str:
     """Get color based on percentage."""
-    if pct > 80:
-        return C_RED
-    elif pct > 60:
-        return C_YELLOW
-    return C_GREEN
+    # Round up so fractional percentages land in the same band as the
+    # `pct > 80` / `pct > 60` thresholds put them
+    return _PCT_COLORS[min(max(math.ceil(pct), 0), 100)]
 
 
-def format_time_until_reset(resets_at: str | None) -> str | None:
-    """Format time remaining until reset."""
-    if not resets_at:
+def parse_reset_epoch(resets_at: object) -> int | None:
+    """Parse an ISO-8601 reset timestamp into epoch seconds."""
+    # Typed as object: a compiled (mypyc) build checks str annotations on
+    # entry, so non-string API values must get this far to be rejected
+    if not resets_at or not isinstance(resets_at, str):
         return None
+    # resets_at only changes when a usage window rolls over, so each refresh
+    # normally finds it already parsed
+    if resets_at in _RESET_EPOCHS:
+        return _RESET_EPOCHS[resets_at]
+    from datetime import datetime
+
     try:
         reset_time = datetime.fromisoformat(resets_at.replace("Z", "+00:00"))
-        now = datetime.now(reset_time.tzinfo)
-        delta = reset_time - now
-        if delta.total_seconds() <= 0:
-            return None
-        total_minutes = int(delta.total_seconds() // 60)
-        hours = total_minutes // 60
-        minutes = total_minutes % 60
-        if hours > 0:
-            return f"{hours}h{minutes:02d}m"
-        return f"{minutes}m"
+        epoch = int(reset_time.timestamp())
     except (ValueError, TypeError):
+        epoch = None
+    if len(_RESET_EPOCHS) >= RESET_EPOCHS_SIZE:
+        _RESET_EPOCHS.clear()
+    _RESET_EPOCHS[resets_at] = epoch
+    return epoch
+
+
+def format_time_until_reset(resets_epoch: int | None) -> str | None:
+    """Format time remaining until reset."""
+    if resets_epoch is None:
+        return None
+    delta = resets_epoch - int(time.time())
+    if delta <= 0:
         return None
+    hours, minutes = divmod(delta // 60, 60)
+    if hours > 0:
+        return f"{hours}h{minutes:02d}m"
+    return f"{minutes}m"
 
 
-def build_progress_bar(pct: int, width: int = 10) -> tuple[str, str]:
+def build_progress_bar(pct: int, width: int = BAR_WIDTH) -> tuple[str, str]:
     """Build a progress bar with dynamic color."""
     color = get_pct_color(pct)
     filled = min(max(pct * width // 100, 0), width)
-    empty = max(width - filled, 0)
-
-    bar_filled = "▓" * filled
-    bar_empty = "░" * empty
+    if width == BAR_WIDTH:
+        bar_filled, bar_empty = _BARS[filled]
+    else:
+        bar_filled, bar_empty = "▓" * filled, "░" * (width - filled)
     return f"{color}{bar_filled}{C_GRAY}{bar_empty}{C_RESET}", color
 
 
-def get_claude_token() -> str | None:
-    """Get Claude access token from macOS Keychain."""
+def _read_keychain_password(service: str) -> tuple[int, bytes | None]:
+    """Read a generic password from the Keychain via Security.framework.
+
+    Returns the OSStatus of the lookup and the password bytes on success.
+    """
+    import ctypes  # Only needed on a cache miss; keep it off the startup path
+
+    cf = ctypes.CDLL(CORE_FOUNDATION)
+    sec = ctypes.CDLL(SECURITY_FRAMEWORK)
+
+    cf.CFStringCreateWithCString.restype = ctypes.c_void_p
+    cf.CFStringCreateWithCString.argtypes = [
+        ctypes.c_void_p,
+        ctypes.c_char_p,
+        ctypes.c_uint32,
+    ]
+    cf.CFDictionaryCreate.restype = ctypes.c_void_p
+    cf.CFDictionaryCreate.argtypes = [
+        ctypes.c_void_p,
+        ctypes.POINTER(ctypes.c_void_p),
+        ctypes.POINTER(ctypes.c_void_p),
+        ctypes.c_long,
+        ctypes.c_void_p,
+        ctypes.c_void_p,
+    ]
+    cf.CFDataGetBytePtr.restype = ctypes.c_void_p
+    cf.CFDataGetBytePtr.argtypes = [ctypes.c_void_p]
+    cf.CFDataGetLength.restype = ctypes.c_long
+    cf.CFDataGetLength.argtypes = [ctypes.c_void_p]
+    cf.CFRelease.restype = None
+    cf.CFRelease.argtypes = [ctypes.c_void_p]
+    sec.SecItemCopyMatching.restype = ctypes.c_int32
+    sec.SecItemCopyMatching.argtypes = [
+        ctypes.c_void_p,
+        ctypes.POINTER(ctypes.c_void_p),
+    ]
+
+    def const(lib: ctypes.CDLL, name: str) -> int | None:
+        return ctypes.c_void_p.in_dll(lib, name).value
+
+    def callbacks(lib: ctypes.CDLL, name: str) -> int:
+        return ctypes.addressof(ctypes.c_void_p.in_dll(lib, name))
+
+    service_ref = cf.CFStringCreateWithCString(
+        None, service.encode(), CF_STRING_ENCODING_UTF8
+    )
+    if not service_ref:
+        return ERR_SEC_ALLOCATE, None
+    try:
+        # Never show an access dialog: the item's ACL usually trusts only the
+        # security CLI, so an untrusted read fails fast with
+        # errSecInteractionNotAllowed and the caller falls back to that CLI
+        keys = (ctypes.c_void_p * 4)(
+            const(sec, "kSecClass"),
+            const(sec, "kSecAttrService"),
+            const(sec, "kSecReturnData"),
+            const(sec, "kSecUseAuthenticationUI"),
+        )
+        values = (ctypes.c_void_p * 4)(
+            const(sec, "kSecClassGenericPassword"),
+            service_ref,
+            const(cf, "kCFBooleanTrue"),
+            const(sec, "kSecUseAuthenticationUIFail"),
+        )
+        query = cf.CFDictionaryCreate(
+            None,
+            keys,
+            values,
+            4,
+            callbacks(cf, "kCFTypeDictionaryKeyCallBacks"),
+            callbacks(cf, "kCFTypeDictionaryValueCallBacks"),
+        )
+    finally:
+        cf.CFRelease(service_ref)
+    if not query:
+        return ERR_SEC_ALLOCATE, None
+
+    result = ctypes.c_void_p()
+    try:
+        status = sec.SecItemCopyMatching(query, ctypes.byref(result))
+    finally:
+        cf.CFRelease(query)
+    if status != ERR_SEC_SUCCESS or not result.value:
+        return status, None
+    try:
+        return status, ctypes.string_at(
+            cf.CFDataGetBytePtr(result), cf.CFDataGetLength(result)
+        )
+    finally:
+        cf.CFRelease(result)
+
+
+def _run_security_find_password(service: str) -> bytes | None:
+    """Read a generic password from the Keychain via the `security` CLI."""
+    import subprocess
+
     try:
         result = subprocess.run(
             [
                 "security",
                 "find-generic-password",
                 "-s",
-                "Claude Code-credentials",
+                service,
                 "-w",
             ],
             capture_output=True,
-            text=True,
             timeout=5,
         )
-        if result.returncode != 0:
-            return None
-        creds = json.loads(result.stdout.strip())
-        # Token is nested in claudeAiOauth
-        oauth = creds.get("claudeAiOauth", {})
-        return oauth.get("accessToken")
-    except (subprocess.TimeoutExpired, json.JSONDecodeError, FileNotFoundError):
+    except (subprocess.TimeoutExpired, FileNotFoundError):
+        return None
+    if result.returncode != 0:
         return None
+    return result.stdout
 
 
-def fetch_usage(token: str) -> dict | None:
-    """Fetch usage data from Anthropic API."""
+def get_claude_token() -> str | None:
+    """Get Claude access token from macOS Keychain."""
+    status: int | None
     try:
-        result = subprocess.run(
-            [
-                "curl",
-                "-s",
-                "--max-time",
-                "5",
-                "https://api.anthropic.com/api/oauth/usage",
-                "-H",
-                f"Authorization: Bearer {token}",
-                "-H",
-                "anthropic-beta: oauth-2025-04-20",
-            ],
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
-        if result.returncode != 0:
-            return None
-        return json.loads(result.stdout)
-    except (subprocess.TimeoutExpired, json.JSONDecodeError):
+        status, secret = _read_keychain_password(KEYCHAIN_SERVICE)
+    except (OSError, AttributeError, ValueError):
+        # Security.framework unavailable (non-macOS or missing symbols)
+        status, secret = None, None
+    if status not in (ERR_SEC_SUCCESS, ERR_SEC_ITEM_NOT_FOUND):
+        # Includes access failures: the item's ACL may only trust the
+        # security CLI, or the detached daemon may not be allowed to prompt
+        secret = _run_security_find_password(KEYCHAIN_SERVICE)
+    if not secret:
         return None
-
-
-def get_cached_usage(cache_file: Path, ttl: int) -> dict | None:
-    """Get cached usage data if still valid."""
-    if not cache_file.exists():
+    try:
+        creds = json.loads(secret)
+    except ValueError:
+        return None
+    # Token is nested in claudeAiOauth
+    oauth = creds.get("claudeAiOauth", {})
+    return oauth.get("accessToken")
+
+
+def fetch_usage(
+    token: str, etag: str | None = None
+) -> tuple[int, dict | None, str | None]:
+    """Fetch usage data from Anthropic API.
+
+    Returns the HTTP status (0 if the request failed), the usage data and the
+    response ETag. Passing the ETag of a previous response makes the request
+    conditional: an unchanged result comes back as a bodiless 304.
+    """
+    import http.client
+    import ssl
+
+    headers = {
+        "Authorization": f"Bearer {token}",
+        "anthropic-beta": "oauth-2025-04-20",
+    }
+    if etag:
+        headers["If-None-Match"] = etag
+    conn = http.client.HTTPSConnection(
+        USAGE_HOST, timeout=5, context=ssl.create_default_context()
+    )
+    try:
+        conn.request("GET", USAGE_PATH, headers=headers)
+        response = conn.getresponse()
+        body = response.read()
+        etag = response.getheader("ETag")
+        if response.status != 200:
+            return response.status, None, etag
+        usage = json.loads(body)
+        return 200, usage if isinstance(usage, dict) else None, etag
+    except (OSError, http.client.HTTPException, json.JSONDecodeError):
+        return 0, None, None
+    finally:
+        conn.close()
+
+
+def get_cached_usage(cache_file: str, ttl: int | None) -> dict | None:
+    """Get cached usage data if still valid (any age when ttl is None)."""
+    try:
+        fd = os.open(cache_file, os.O_RDONLY)
+    except OSError:
         return None
     try:
-        mtime = cache_file.stat().st_mtime
-        if time.time() - mtime > ttl:
+        st = os.fstat(fd)
+        if ttl is not None and time.time() - st.st_mtime > ttl:
             return None
-        with open(cache_file) as f:
-            return json.load(f)
-    except (OSError, json.JSONDecodeError):
+        data = json.loads(os.read(fd, st.st_size))
+        return data if isinstance(data, dict) else None
+    except (OSError, ValueError):
         return None
+    finally:
+        os.close(fd)
 
 
-def save_cache(cache_file: Path, data: dict) -> None:
+def save_cache(cache_file: str, data: dict) -> None:
     """Save usage data to cache."""
+    import tempfile
+
+    # Write a temp file and rename it over the cache, so a concurrent poll
+    # sees either the old or the new contents, never a truncated file
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, prefix=".tmp-")
+    except OSError:
+        return
     try:
-        CACHE_DIR.mkdir(parents=True, exist_ok=True)
-        with open(cache_file, "w") as f:
-            json.dump(data, f)
+        with os.fdopen(fd, "wb") as f:
+            f.write(json.dumps(data).encode())
+        os.replace(tmp_path, cache_file)
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+
+def touch_cache(cache_file: str) -> None:
+    """Mark cached usage data as fresh without rewriting it."""
+    try:
+        os.utime(cache_file, None)
     except OSError:
         pass
 
 
+def store_usage(cache_file: str, data: dict, previous: dict | None) -> None:
+    """Save usage data, only renewing the TTL when it is unchanged."""
+    if data == previous:
+        touch_cache(cache_file)
+    else:
+        save_cache(cache_file, data)
+
+
 def get_usage_data() -> tuple[dict | None, dict | None]:
     """Get session (5h) and weekly (7d) usage data."""
     # Try session cache
@@ -190,7 +425,21 @@ def get_usage_data() -> tuple[dict | None, dict | None]:
     if not token:
         return None, None
 
-    usage = fetch_usage(token)
+    # With stale copies of both caches, the request can be conditional on
+    # the ETag they were built from; a 304 just renews their TTLs. The copies
+    # also let unchanged values skip the rewrite below.
+    stale_session = session_data or get_cached_usage(SESSION_CACHE, None)
+    stale_weekly = weekly_data or get_cached_usage(WEEKLY_CACHE, None)
+    etag = None
+    if stale_session is not None and stale_weekly is not None:
+        etag_data = get_cached_usage(ETAG_CACHE, None)
+        etag = etag_data.get("etag") if etag_data else None
+
+    status, usage, new_etag = fetch_usage(token, etag)
+    if status == 304 and etag:
+        touch_cache(SESSION_CACHE)
+        touch_cache(WEEKLY_CACHE)
+        return stale_session, stale_weekly
     if not usage:
         return None, None
 
@@ -200,27 +449,38 @@ def get_usage_data() -> tuple[dict | None, dict | None]:
         session_data = {
             "pct": int(float(five_hour.get("utilization", 0))),
             "resets_at": five_hour.get("resets_at"),
+            "resets_epoch": parse_reset_epoch(five_hour.get("resets_at")),
         }
-        save_cache(SESSION_CACHE, session_data)
+        store_usage(SESSION_CACHE, session_data, stale_session)
 
     seven_day = usage.get("seven_day", {})
     if seven_day:
         weekly_data = {
             "pct": int(float(seven_day.get("utilization", 0))),
             "resets_at": seven_day.get("resets_at"),
+            "resets_epoch": parse_reset_epoch(seven_day.get("resets_at")),
         }
-        save_cache(WEEKLY_CACHE, weekly_data)
+        store_usage(WEEKLY_CACHE, weekly_data, stale_weekly)
+
+    if new_etag:
+        if new_etag != etag:
+            save_cache(ETAG_CACHE, {"etag": new_etag})
+    elif etag:
+        # The API stopped sending ETags; don't keep revalidating against one
+        try:
+            os.unlink(ETAG_CACHE)
+        except OSError:
+            pass
 
     return session_data, weekly_data
 
 
-def main():
+def render(payload: bytes, session_data: dict | None, weekly_data: dict | None) -> str:
+    """Render the statusline for one poll's JSON payload."""
     try:
-        data = json.load(sys.stdin)
-    except (json.JSONDecodeError, ValueError):
-        return
-
-    parts = []
+        data = json.loads(payload)
+    except ValueError:
+        return ""
 
     # Model and version
     model_data = data.get("model", {})
@@ -257,57 +517,249 @@ def main():
     else:
         model_part = f"{model_color}{model_short}{C_RESET}"
 
-    parts.append(model_part)
-    parts.append(f"{C_TEXT}v{version}{C_RESET}")
-
     # Context window usage (just percentage)
-    usage = data.get("context_window", {}).get("current_usage")
-    size = data.get("context_window", {}).get("context_window_size", 200000)
-
-    if usage:
-        current = (
-            usage.get("input_tokens", 0)
-            + usage.get("cache_creation_input_tokens", 0)
-            + usage.get("cache_read_input_tokens", 0)
-        )
-    else:
-        current = 0
-
-    autocompact_threshold = size * 775 // 1000
+    context_window = data.get("context_window", {})
+    usage = context_window.get("current_usage")
+    size = context_window.get("context_window_size", DEFAULT_CONTEXT_WINDOW)
+
+    current = sum(map(usage.get, CONTEXT_TOKEN_KEYS, _NO_TOKENS)) if usage else 0
+
+    # One expression, so a mypyc build leaves the type open: a float size from
+    # the payload must not trip an int check the default branch would imply
+    autocompact_threshold = (
+        size * 775 // 1000
+        if size != DEFAULT_CONTEXT_WINDOW
+        else DEFAULT_AUTOCOMPACT_THRESHOLD
+    )
     context_pct = (
         min(current * 100 // autocompact_threshold, 100)
         if autocompact_threshold > 0
         else 0
     )
     context_color = get_pct_color(context_pct)
-    parts.append(f"{C_TEXT}context: {context_color}{context_pct}%{C_RESET}")
 
     # Session and weekly usage
-    session_data, weekly_data = get_usage_data()
-
+    session_part = ""
     if session_data is not None:
         pct = session_data.get("pct", 0)
-        bar, _ = build_progress_bar(pct, 8)
+        bar, _ = build_progress_bar(pct)
         color = get_pct_color(pct)
-        reset_str = format_time_until_reset(session_data.get("resets_at"))
+        reset_str = format_time_until_reset(session_data.get("resets_epoch"))
         reset_part = (
             f" {C_TEXT}reset: {C_GREEN}{reset_str}{C_RESET}" if reset_str else ""
         )
-        parts.append(
-            f"{C_TEXT}session: {color}{pct}%{C_RESET} {C_GRAY}[{C_RESET}{bar}{C_GRAY}]{C_RESET}{reset_part}"
+        session_part = (
+            f"{SEPARATOR}{C_TEXT}session: {color}{pct}%{C_RESET}"
+            f" {C_GRAY}[{C_RESET}{bar}{C_GRAY}]{C_RESET}{reset_part}"
         )
 
+    weekly_part = ""
     if weekly_data is not None:
         pct = weekly_data.get("pct", 0)
-        bar, _ = build_progress_bar(pct, 8)
+        bar, _ = build_progress_bar(pct)
         color = get_pct_color(pct)
-        parts.append(
-            f"{C_TEXT}weekly: {color}{pct}%{C_RESET} {C_GRAY}[{C_RESET}{bar}{C_GRAY}]{C_RESET}"
+        weekly_part = (
+            f"{SEPARATOR}{C_TEXT}weekly: {color}{pct}%{C_RESET}"
+            f" {C_GRAY}[{C_RESET}{bar}{C_GRAY}]{C_RESET}"
+        )
+
+    return (
+        f"{model_part}{SEPARATOR}{C_TEXT}v{version}{C_RESET}"
+        f"{SEPARATOR}{C_TEXT}context: {context_color}{context_pct}%{C_RESET}"
+        f"{session_part}{weekly_part}"
+    )
+
+
+def write_stdout(data: bytes) -> None:
+    """Write bytes straight to fd 1, bypassing sys.stdout's buffering."""
+    while data:
+        data = data[os.write(1, data) :]
+
+
+def query_daemon(payload: bytes) -> bytes | None:
+    """Render the statusline through the running daemon.
+
+    Returns None if the daemon did not answer or sent an empty reply, and
+    raises FileNotFoundError or ConnectionRefusedError when no daemon is
+    listening at all.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(DAEMON_TIMEOUT)
+        try:
+            sock.connect(DAEMON_SOCKET)
+        except (FileNotFoundError, ConnectionRefusedError):
+            raise
+        except OSError:
+            return None
+        try:
+            sock.sendall(payload)
+            sock.shutdown(socket.SHUT_WR)
+            chunks = []
+            while chunk := sock.recv(4096):
+                chunks.append(chunk)
+            # An empty reply means the daemon failed (or got invalid JSON);
+            # either way the caller re-renders in-process
+            return b"".join(chunks) or None
+        except OSError:
+            return None
+
+
+def spawn_daemon() -> None:
+    """Start a detached daemon to answer subsequent polls."""
+    import subprocess
+
+    try:
+        subprocess.Popen(
+            [sys.executable, os.path.abspath(sys.argv[0]), "--daemon"],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
         )
+    except OSError:
+        pass
+
+
+def _script_mtime() -> float | None:
+    try:
+        return os.stat(sys.argv[0]).st_mtime
+    except OSError:
+        return None
 
-    # Join with separator
-    separator = f" {C_GRAY}│{C_RESET} "
-    print(separator.join(parts), end="")
+
+class _Daemon:
+    """State the daemon keeps between polls."""
+
+    # Plain methods rather than closures over serve()'s locals: mypyc
+    # miscompiles nested async functions that rebind variables via nonlocal
+
+    def __init__(self, session_data: dict | None, weekly_data: dict | None) -> None:
+        self.session_data = session_data
+        self.weekly_data = weekly_data
+        self.last_poll = time.monotonic()
+        # Recent renders keyed by payload: adjacent polls often send identical
+        # JSON, so they can reuse the output without parsing it again
+        self.rendered: dict[bytes, tuple[float, bytes]] = {}
+
+    async def handle(
+        self, reader: "asyncio.StreamReader", writer: "asyncio.StreamWriter"
+    ) -> None:
+        """Answer one poll with the rendered statusline."""
+        try:
+            payload = await reader.read()
+            self.last_poll = now = time.monotonic()
+            hit = self.rendered.get(payload)
+            if hit is not None and now - hit[0] < HOT_CACHE_TTL:
+                output = hit[1]
+            else:
+                output = render(payload, self.session_data, self.weekly_data).encode()
+                if len(self.rendered) >= HOT_CACHE_SIZE:
+                    self.rendered.clear()
+                self.rendered[payload] = (now, output)
+            writer.write(output)
+            await writer.drain()
+        except Exception:
+            # Close without replying so the client renders in-process, where
+            # the error surfaces with a traceback
+            pass
+        finally:
+            writer.close()
+
+    async def refresh(self) -> None:
+        """Refresh usage data every SESSION_TTL, starting immediately."""
+        import asyncio
+
+        while True:
+            try:
+                usage = await asyncio.to_thread(get_usage_data)
+                self.session_data, self.weekly_data = usage
+                self.rendered.clear()
+            except Exception:
+                pass
+            await asyncio.sleep(SESSION_TTL)
+
+
+async def serve() -> None:
+    """Answer polls over a Unix socket, refreshing usage in the background."""
+    import asyncio
+    import fcntl
+    import signal
+
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        lock = open(DAEMON_LOCK, "w")
+    except OSError:
+        return
+    try:
+        fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        # Another daemon already owns the socket
+        lock.close()
+        return
+
+    # Answer polls straight away from whatever is cached, however old; the
+    # refresh task fetches current usage in the background
+    daemon = _Daemon(
+        get_cached_usage(SESSION_CACHE, None), get_cached_usage(WEEKLY_CACHE, None)
+    )
+
+    # Exit when Claude Code stops polling or the script is updated, so the
+    # next poll starts a daemon running the current code
+    script_mtime = _script_mtime()
+    stop = asyncio.Event()
+    asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, stop.set)
+    try:
+        server = await asyncio.start_unix_server(daemon.handle, path=DAEMON_SOCKET)
+    except OSError:
+        lock.close()
+        return
+    refresher = asyncio.create_task(daemon.refresh())
+    try:
+        async with server:
+            while True:
+                try:
+                    await asyncio.wait_for(stop.wait(), DAEMON_CHECK_INTERVAL)
+                    break
+                except asyncio.TimeoutError:
+                    pass
+                if time.monotonic() - daemon.last_poll > DAEMON_IDLE_TIMEOUT:
+                    break
+                if _script_mtime() != script_mtime:
+                    break
+    finally:
+        refresher.cancel()
+        try:
+            os.unlink(DAEMON_SOCKET)
+        except OSError:
+            pass
+        lock.close()
+
+
+def main() -> None:
+    if sys.argv[1:] == ["--daemon"]:
+        import asyncio
+
+        asyncio.run(serve())
+        return
+
+    payload = sys.stdin.buffer.read()
+    try:
+        output = query_daemon(payload)
+        daemon_running = True
+    except (FileNotFoundError, ConnectionRefusedError):
+        output = None
+        daemon_running = False
+    if output is not None:
+        write_stdout(output)
+        return
+
+    # Render in-process; start a daemon for the next poll only if none is
+    # listening, since one that is alive but failing would just be replaced
+    # by another that loses the lock
+    session_data, weekly_data = get_usage_data()
+    write_stdout(render(payload, session_data, weekly_data).encode())
+    if not daemon_running:
+        spawn_daemon()
 
 
 if __name__ == "__main__":